@@ -14,7 +14,7 @@ Mobile Notifications Setup (Optional):
     3. Download service account JSON from Project Settings > Service Accounts
     4. Save it as 'firebase-service-account.json' in this directory
     5. Set FIREBASE_DATABASE_URL below (or use environment variable)
-    6. Install firebase-admin: pip install firebase-admin
+    6. Install the HTTP client libraries: pip install google-auth requests
 """
 
 import sys
@@ -22,10 +22,24 @@ import time
 import platform
 import subprocess
 import threading
+import queue
+import random
+import atexit
+import contextlib
 import re
 import os
+import ctypes
+import signal
+import selectors
 from datetime import datetime
 
+# orjson is optional; it serializes event payloads (including datetimes) faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -41,29 +55,46 @@ FIREBASE_DATABASE_URL = os.environ.get(
     ''  # e.g., 'https://your-project-id.firebaseio.com'
 )
 
+# Mobile events are written to Firebase in batches of at most this many
+FIREBASE_BATCH_SIZE = 50
+FIREBASE_MAX_RETRIES = 5
+
+# Start/stop toggles closer together than this are coalesced into one event
+MOBILE_DEBOUNCE_SECONDS = 0.5
+
+# OAuth2 scopes needed to write to the Realtime Database REST API
+FIREBASE_SCOPES = [
+    'https://www.googleapis.com/auth/firebase.database',
+    'https://www.googleapis.com/auth/userinfo.email',
+]
+
+# macOS log stream fallback: only consider records from these subsystems so
+# logd filters at the source. Set to '' to match on the message alone.
+MAC_LOG_SUBSYSTEMS = os.environ.get(
+    'MAC_LOG_SUBSYSTEMS',
+    'com.apple.cmio,com.apple.avfoundation'
+)
+
 # Local alert sound (macOS)
 BEEP_SOUND_FILE = 'BEEP.aiff'
 BEEP_VOLUME = 2  # 1-10
 
+# Host details never change while running, so look them up once
+_DEVICE_NAME = platform.node()
+_DEVICE_OS = platform.system()
+
 # ============================================================================
 # FIREBASE INITIALIZATION (Graceful degradation if not configured)
 # ============================================================================
 
 FIREBASE_ENABLED = False
-_firebase_db = None
+_session = None          # Keep-alive HTTPS session to the database
+_credentials = None      # Service account OAuth2 credentials
+_auth_request = None     # Transport used to refresh the access token
 
 def _init_firebase():
     """Initialize Firebase if credentials are available. Returns True if successful."""
-    global FIREBASE_ENABLED, _firebase_db
-    
-    # Check if firebase-admin is installed
-    try:
-        import firebase_admin
-        from firebase_admin import credentials, db
-    except ImportError:
-        print("ℹ️  firebase-admin not installed - mobile notifications disabled")
-        print("   To enable: pip install firebase-admin")
-        return False
+    global FIREBASE_ENABLED, _session, _credentials, _auth_request
     
     # Check for credentials file
     if not os.path.exists(FIREBASE_CREDENTIALS_FILE):
@@ -77,14 +108,33 @@ def _init_firebase():
         print("   Set it in the script or as an environment variable")
         return False
     
+    # Check if the REST client libraries are installed (imported only now,
+    # so local-only use never pays for loading the HTTP/auth stack)
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from google.auth.transport.requests import Request
+        from google.oauth2 import service_account
+    except ImportError:
+        print("ℹ️  google-auth/requests not installed - mobile notifications disabled")
+        print("   To enable: pip install google-auth requests")
+        return False
+    
     # Try to initialize
     try:
-        cred = credentials.Certificate(FIREBASE_CREDENTIALS_FILE)
-        firebase_admin.initialize_app(cred, {
-            'databaseURL': FIREBASE_DATABASE_URL
-        })
-        _firebase_db = db
+        creds = service_account.Credentials.from_service_account_file(
+            FIREBASE_CREDENTIALS_FILE, scopes=FIREBASE_SCOPES
+        )
+        auth_request = Request()
+        creds.refresh(auth_request)
+        
+        # One persistent connection, reused across events (no TLS handshake per write)
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        
+        _session, _credentials, _auth_request = session, creds, auth_request
         FIREBASE_ENABLED = True
+        threading.Thread(target=_flusher, daemon=True).start()
         print("✅ Firebase initialized - mobile notifications enabled")
         return True
     except Exception as e:
@@ -95,205 +145,731 @@ def _init_firebase():
 # MOBILE NOTIFICATION
 # ============================================================================
 
+# Event payloads waiting for the flusher thread (details already truncated).
+# Bounded: when Firebase is unreachable, new events are counted and dropped
+# rather than blocking the monitor.
+_event_q = queue.Queue(maxsize=1024)
+_dropped_lock = threading.Lock()
+_dropped = 0  # Events dropped on a full queue since the last flush
+
+_PUSH_CHARS = '-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'
+_last_push_time = 0
+_last_push_rand = []
+
+def _generate_push_id():
+    """
+    Generate a Firebase push ID locally (same algorithm as the client SDKs).
+    IDs sort chronologically, so batched events keep their order.
+    """
+    global _last_push_time, _last_push_rand
+    
+    now = int(time.time() * 1000)
+    duplicate_time = now == _last_push_time
+    _last_push_time = now
+    
+    time_chars = []
+    for _ in range(8):
+        time_chars.append(_PUSH_CHARS[now % 64])
+        now //= 64
+    
+    if not duplicate_time:
+        _last_push_rand = [random.randrange(64) for _ in range(12)]
+    else:
+        # Same millisecond: increment the random part so IDs stay ordered
+        i = 11
+        while i >= 0 and _last_push_rand[i] == 63:
+            _last_push_rand[i] = 0
+            i -= 1
+        _last_push_rand[i] += 1
+    
+    return ''.join(reversed(time_chars)) + ''.join(_PUSH_CHARS[n] for n in _last_push_rand)
+
+def _json_dumps(obj):
+    """Serialize obj to JSON bytes, writing datetimes in ISO 8601."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=datetime.isoformat, separators=(',', ':')).encode()
+
+def _firebase_update(batch):
+    """Commit a batch of events to /webcam_events with one REST PATCH."""
+    if not _credentials.valid:
+        _credentials.refresh(_auth_request)
+    
+    response = _session.patch(
+        f"{FIREBASE_DATABASE_URL.rstrip('/')}/webcam_events.json",
+        params={'access_token': _credentials.token},
+        data=_json_dumps(batch),
+        headers={'Content-Type': 'application/json'},
+        timeout=5
+    )
+    response.raise_for_status()
+
+def _flusher():
+    """
+    Background writer: drain queued events and commit them to Firebase
+    with a single multi-path update per batch, retrying with backoff.
+    """
+    global _dropped
+    
+    while True:
+        items = [_event_q.get()]
+        while len(items) < FIREBASE_BATCH_SIZE:
+            try:
+                items.append(_event_q.get_nowait())
+            except queue.Empty:
+                break
+        
+        batch = {}
+        
+        # Report overflow as a single record, ahead of this batch's events
+        with _dropped_lock:
+            dropped, _dropped = _dropped, 0
+        if dropped:
+            print(f"   ⚠️  {dropped} mobile event(s) were dropped while the queue was full")
+            batch[_generate_push_id()] = {
+                'type': 'dropped',
+                'count': dropped,
+                'timestamp': int(time.time() * 1000),
+                'datetime': datetime.now(),
+                'device_name': _DEVICE_NAME,
+                'device_os': _DEVICE_OS
+            }
+        
+        for payload in items:
+            payload['datetime'] = datetime.fromtimestamp(payload['timestamp'] / 1000)
+            payload['device_name'] = _DEVICE_NAME
+            payload['device_os'] = _DEVICE_OS
+            batch[_generate_push_id()] = payload
+        
+        delay = 1
+        for attempt in range(1, FIREBASE_MAX_RETRIES + 1):
+            try:
+                _firebase_update(batch)
+                print(f"   📱 Mobile notified: {', '.join(payload['type'] for payload in items)}")
+                break
+            except Exception as e:
+                if attempt == FIREBASE_MAX_RETRIES:
+                    print(f"   ⚠️  Failed to notify mobile, dropping {len(batch)} event(s): {e}")
+                else:
+                    print(f"   ⚠️  Failed to notify mobile (retrying in {delay}s): {e}")
+                    time.sleep(delay)
+                    delay *= 2
+
+# Debouncer state: only the latest event inside the window is sent, and
+# only if it differs from the last event handed to the writer
+_pending_lock = threading.Lock()
+_pending_state = None      # Event payload awaiting the timer
+_pending_timer = None
+_last_sent_state = None    # event_type of the last event queued for Firebase
+
+def _flush_pending():
+    """Timer callback: queue the debounced event if the state actually changed."""
+    global _pending_state, _pending_timer, _last_sent_state
+    
+    with _pending_lock:
+        payload = _pending_state
+        _pending_state = None
+        _pending_timer = None
+        if payload is None or payload['type'] == _last_sent_state:
+            return
+        _last_sent_state = payload['type']
+    
+    _enqueue(payload)
+
+def _enqueue(payload):
+    """Hand an event to the flusher, counting it as dropped if the queue is full."""
+    global _dropped
+    
+    try:
+        _event_q.put_nowait(payload)
+    except queue.Full:
+        with _dropped_lock:
+            _dropped += 1
+            if _dropped == 1:
+                print("   ⚠️  Mobile notification queue full - dropping events")
+
+def _cancel_pending():
+    """Stop a pending debounce timer so it doesn't fire during shutdown."""
+    with _pending_lock:
+        if _pending_timer is not None:
+            _pending_timer.cancel()
+
+atexit.register(_cancel_pending)
+
 def notify_mobile(event_type: str, details: str = ""):
     """
-    Send webcam event to Firebase for mobile app consumption.
-    Silently does nothing if Firebase is not configured.
+    Queue a webcam event for the Firebase writer thread.
+    Never blocks; silently does nothing if Firebase is not configured.
+    Rapid toggles are coalesced over MOBILE_DEBOUNCE_SECONDS.
     
     Args:
         event_type: 'start' or 'stop'
         details: Optional additional information (e.g., log line)
     """
-    if not FIREBASE_ENABLED or _firebase_db is None:
+    global _pending_state, _pending_timer
+    
+    if not FIREBASE_ENABLED:
         return
     
-    try:
-        ref = _firebase_db.reference('webcam_events')
-        event_data = {
-            'type': event_type,
-            'timestamp': int(time.time() * 1000),  # milliseconds for JS compatibility
-            'datetime': datetime.now().isoformat(),
-            'device_name': platform.node(),
-            'device_os': platform.system(),
-            'details': details[:500] if details else ""  # Limit details length
-        }
-        ref.push(event_data)
-        print(f"   📱 Mobile notified: {event_type}")
-    except Exception as e:
-        print(f"   ⚠️  Failed to notify mobile: {e}")
+    # Truncate here, before the event crosses to other threads, so a burst
+    # of long log lines can't pin kilobytes per event in the queue
+    payload = {
+        'type': event_type,
+        'timestamp': int(time.time() * 1000),  # milliseconds for JS compatibility
+        'details': (details or "")[:500]  # Limit details length
+    }
+    
+    with _pending_lock:
+        _pending_state = payload
+        if _pending_timer is not None:
+            _pending_timer.cancel()
+        _pending_timer = threading.Timer(MOBILE_DEBOUNCE_SECONDS, _flush_pending)
+        _pending_timer.daemon = True
+        _pending_timer.start()
 
 # ============================================================================
 # SOUND ALERT
 # ============================================================================
 
+# Resolved once: fall back to a system sound if the custom file doesn't exist
+_MAC_SOUND = (
+    BEEP_SOUND_FILE if os.path.exists(BEEP_SOUND_FILE)
+    else '/System/Library/Sounds/Ping.aiff'
+)
+_last_beep_proc = None  # Most recent afplay process (macOS)
+
 def play_beep():
-    """Play an alert sound appropriate for the current OS."""
-    os_name = platform.system()
+    """Play an alert sound appropriate for the current OS without blocking."""
+    global _last_beep_proc
+    os_name = _DEVICE_OS
     
     if os_name == 'Windows':
-        try:
-            import winsound
-            winsound.Beep(1000, 500)  # Frequency 1000 Hz, duration 500 ms
-        except Exception as e:
-            print(f"   ⚠️  Sound error: {e}")
+        def beep():
+            try:
+                import winsound
+                winsound.Beep(1000, 500)  # Frequency 1000 Hz, duration 500 ms
+            except Exception as e:
+                print(f"   ⚠️  Sound error: {e}")
+        
+        # Beep() blocks for its whole duration, so keep it off the monitor thread
+        threading.Thread(target=beep, daemon=True).start()
             
     elif os_name == 'Darwin':  # macOS
-        sound_file = BEEP_SOUND_FILE
-        # Fallback to system sound if custom file doesn't exist
-        if not os.path.exists(sound_file):
-            sound_file = '/System/Library/Sounds/Ping.aiff'
+        # Reap the previous player so finished ones don't linger as zombies
+        if _last_beep_proc is not None:
+            _last_beep_proc.poll()
         try:
-            subprocess.call(['afplay', '-v', str(BEEP_VOLUME), sound_file])
+            _last_beep_proc = subprocess.Popen(
+                ['afplay', '-v', str(BEEP_VOLUME), _MAC_SOUND],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
         except Exception as e:
             print(f"   ⚠️  Sound error: {e}")
             
     else:  # Linux and others
         print('\a')  # Terminal bell
 
+# ============================================================================
+# STATE CHANGE REPORTING
+# ============================================================================
+
+def report_state(in_use: bool, was_in_use: bool, details=""):
+    """
+    Announce a webcam state transition and return the new state.
+    
+    Only an actual change beeps or notifies, so a source that repeats the
+    same start/stop signal never produces duplicate alerts or writes.
+    
+    Args:
+        in_use: Whether the webcam is in use now
+        was_in_use: The state last reported
+        details: Optional additional information; a raw log line (bytes)
+            is only decoded if it is actually sent
+    """
+    if in_use == was_in_use:
+        return in_use
+    
+    if isinstance(details, bytes):
+        details = details.decode('utf-8', 'replace')
+    
+    if in_use:
+        print(f"🔴 Webcam STARTED - {datetime.now().strftime('%H:%M:%S')}")
+        play_beep()
+        notify_mobile('start', details)
+    else:
+        print(f"⚪ Webcam STOPPED - {datetime.now().strftime('%H:%M:%S')}")
+        notify_mobile('stop', details)
+    return in_use
+
 # ============================================================================
 # WINDOWS WEBCAM MONITORING
 # ============================================================================
 
-def monitor_webcam_windows():
-    """Monitor webcam access on Windows via registry polling."""
+WEBCAM_REG_PATH = r"Software\Microsoft\Windows\CurrentVersion\CapabilityAccessManager\ConsentStore\webcam"
+
+# RegNotifyChangeKeyValue / WaitForSingleObject constants (winnt.h, winbase.h)
+REG_NOTIFY_CHANGE_NAME = 0x00000001
+REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+_advapi32 = None
+_kernel32 = None
+
+def _load_win32_notify_api():
+    """Bind the Win32 calls used for registry change notifications via ctypes."""
+    global _advapi32, _kernel32
+    import ctypes
+    from ctypes import wintypes
+    
+    advapi32 = ctypes.WinDLL('advapi32')
+    advapi32.RegNotifyChangeKeyValue.argtypes = [
+        wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL
+    ]
+    advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+    
+    kernel32 = ctypes.WinDLL('kernel32')
+    kernel32.CreateEventW.argtypes = [
+        wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR
+    ]
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    _advapi32, _kernel32 = advapi32, kernel32
+
+# App subkey name -> open HKEY, cached between scans so each scan is one
+# QueryValueEx per app instead of an enumerate/open/query/close sequence
+_pkg_handles = {}      # Packaged apps (Microsoft Store apps)
+_nonpkg_handles = {}   # Non-packaged apps (traditional desktop apps)
+_subkey_counts = {}    # Parent key path -> subkey count seen at last sync
+
+def _sync_handles(cache, parent_path, skip=None):
+    """
+    Bring cache in line with the app subkeys under parent_path.
+    
+    Re-enumerates only when the parent's subkey count has changed; otherwise
+    this is just an OpenKey + QueryInfoKey on the parent.
+    """
     import winreg
     
-    was_in_use = False
-    print("Monitoring Windows webcam registry...\n")
+    try:
+        parent = winreg.OpenKey(winreg.HKEY_CURRENT_USER, parent_path)
+    except FileNotFoundError:
+        for handle in cache.values():
+            winreg.CloseKey(handle)
+        cache.clear()
+        _subkey_counts.pop(parent_path, None)
+        return
     
-    while True:
-        in_use = False
-        try:
-            # Check packaged apps (Microsoft Store apps)
+    with parent:
+        subkey_count = winreg.QueryInfoKey(parent)[0]
+        if subkey_count == _subkey_counts.get(parent_path):
+            return
+        
+        names = set()
+        for i in range(subkey_count):
             try:
-                key = winreg.OpenKey(
-                    winreg.HKEY_CURRENT_USER,
-                    r"Software\Microsoft\Windows\CurrentVersion\CapabilityAccessManager\ConsentStore\webcam"
-                )
-                i = 0
-                while True:
-                    try:
-                        subkey_name = winreg.EnumKey(key, i)
-                        if subkey_name == "NonPackaged":
-                            i += 1
-                            continue
-                        subkey = winreg.OpenKey(key, subkey_name)
-                        try:
-                            last_used_stop, _ = winreg.QueryValueEx(subkey, "LastUsedTimeStop")
-                            if last_used_stop == 0:
-                                in_use = True
-                        except FileNotFoundError:
-                            pass
-                        winreg.CloseKey(subkey)
-                        if in_use:
-                            break
-                        i += 1
-                    except OSError:
-                        break
-                winreg.CloseKey(key)
-            except FileNotFoundError:
+                names.add(winreg.EnumKey(parent, i))
+            except OSError:
+                break
+        names.discard(skip)
+        
+        for name in list(cache):
+            if name not in names:
+                winreg.CloseKey(cache.pop(name))
+        for name in names.difference(cache):
+            try:
+                cache[name] = winreg.OpenKey(parent, name)
+            except OSError:
                 pass
+        _subkey_counts[parent_path] = subkey_count
 
-            # Check non-packaged apps (traditional desktop apps)
-            if not in_use:
-                try:
-                    key = winreg.OpenKey(
-                        winreg.HKEY_CURRENT_USER,
-                        r"Software\Microsoft\Windows\CurrentVersion\CapabilityAccessManager\ConsentStore\webcam\NonPackaged"
-                    )
-                    i = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            subkey = winreg.OpenKey(key, subkey_name)
-                            try:
-                                last_used_stop, _ = winreg.QueryValueEx(subkey, "LastUsedTimeStop")
-                                if last_used_stop == 0:
-                                    in_use = True
-                            except FileNotFoundError:
-                                pass
-                            winreg.CloseKey(subkey)
-                            if in_use:
-                                break
-                            i += 1
-                        except OSError:
-                            break
-                    winreg.CloseKey(key)
-                except FileNotFoundError:
-                    pass
-                    
-        except Exception as e:
-            print(f"Error checking registry: {e}")
-
-        # State change detection
-        if in_use and not was_in_use:
-            print(f"🔴 Webcam STARTED - {datetime.now().strftime('%H:%M:%S')}")
-            play_beep()
-            notify_mobile('start')
-        elif not in_use and was_in_use:
-            print(f"⚪ Webcam STOPPED - {datetime.now().strftime('%H:%M:%S')}")
-            notify_mobile('stop')
+def _close_cached_handles():
+    """Close every cached app subkey handle."""
+    import winreg
+    
+    for cache in (_pkg_handles, _nonpkg_handles):
+        for handle in cache.values():
+            winreg.CloseKey(handle)
+        cache.clear()
+    _subkey_counts.clear()
+
+def _any_in_use(cache, parent_path, skip=None):
+    """Return True if any app under parent_path has LastUsedTimeStop == 0."""
+    import winreg
+    
+    _sync_handles(cache, parent_path, skip=skip)
+    for name, handle in list(cache.items()):
+        try:
+            last_used_stop, _ = winreg.QueryValueEx(handle, "LastUsedTimeStop")
+        except FileNotFoundError:
+            continue
+        except OSError:
+            # Subkey was deleted - evict it and re-enumerate on the next scan
+            winreg.CloseKey(cache.pop(name))
+            _subkey_counts.pop(parent_path, None)
+            continue
+        if last_used_stop == 0:
+            return True
+    return False
+
+def _webcam_in_use_windows():
+    """Return True if any app currently holds the webcam (LastUsedTimeStop == 0)."""
+    # Packaged apps (Microsoft Store apps) first, then traditional desktop apps
+    return (
+        _any_in_use(_pkg_handles, WEBCAM_REG_PATH, skip="NonPackaged")
+        or _any_in_use(_nonpkg_handles, WEBCAM_REG_PATH + r"\NonPackaged")
+    )
+
+def _poll_interval(stable_for):
+    """
+    Seconds to wait before the next registry poll, given how long the
+    webcam state has been unchanged: 100ms for 10s after a transition,
+    then doubling every 10s up to 5s.
+    """
+    if stable_for < 10:
+        return 0.1
+    return min(5.0, 0.25 * 2 ** min(5, int(stable_for / 10)))
+
+def monitor_webcam_windows():
+    """
+    Monitor webcam access on Windows via registry change notifications.
+    
+    The thread blocks in the kernel until something under the webcam
+    ConsentStore key changes, then rescans once. Falls back to adaptive
+    polling if notifications cannot be set up.
+    """
+    import winreg
+    
+    # Every handle opened here is registered with the ExitStack, so all of
+    # them are released however the monitor exits
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(_close_cached_handles)
+        
+        watching = False
+        try:
+            _load_win32_notify_api()
+            watch_key = cleanup.enter_context(winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, WEBCAM_REG_PATH, 0, winreg.KEY_NOTIFY
+            ))
+            watch_event = _kernel32.CreateEventW(None, False, False, None)
+            if not watch_event:
+                raise OSError("CreateEventW failed")
+            cleanup.callback(_kernel32.CloseHandle, watch_event)
+            watching = True
+        except OSError as e:
+            print(f"⚠️  Registry notifications unavailable ({e}) - falling back to polling")
+        
+        was_in_use = False
+        stable_since = time.monotonic()
+        print("Monitoring Windows webcam registry...\n")
+        
+        while True:
+            # Re-arm before scanning so a change during the scan isn't missed
+            if watching:
+                status = _advapi32.RegNotifyChangeKeyValue(
+                    watch_key.handle,
+                    True,  # Watch the whole subtree (includes NonPackaged)
+                    REG_NOTIFY_CHANGE_NAME | REG_NOTIFY_CHANGE_LAST_SET,
+                    watch_event,
+                    True
+                )
+                if status != 0:
+                    print(f"⚠️  RegNotifyChangeKeyValue failed ({status}) - falling back to polling")
+                    watching = False
+            
+            in_use = False
+            try:
+                in_use = _webcam_in_use_windows()
+            except Exception as e:
+                print(f"Error checking registry: {e}")
+
+            if in_use != was_in_use:
+                stable_since = time.monotonic()
+            was_in_use = report_state(in_use, was_in_use)
+            
+            if not watching:
+                time.sleep(_poll_interval(time.monotonic() - stable_since))
+                continue
             
-        was_in_use = in_use
-        time.sleep(1)  # Poll every second
+            # Block until the key changes. The timeout only exists so Ctrl+C
+            # is handled promptly; nothing is rescanned on a timeout.
+            result = _kernel32.WaitForSingleObject(watch_event, 1000)
+            while result == WAIT_TIMEOUT:
+                result = _kernel32.WaitForSingleObject(watch_event, 1000)
+            if result != WAIT_OBJECT_0:
+                print("⚠️  Waiting for registry change failed - falling back to polling")
+                watching = False
 
 # ============================================================================
 # MACOS WEBCAM MONITORING
 # ============================================================================
 
-def monitor_webcam_mac():
-    """Monitor webcam access on macOS via system log stream."""
-    command = [
-        'log', 'stream', '--predicate',
-        'eventMessage CONTAINS "AVCaptureSessionDidStartRunningNotification" OR '
-        'eventMessage CONTAINS "AVCaptureSessionDidStopRunningNotification"'
+def _fourcc(code):
+    """Convert a four-character code such as 'glob' to its UInt32 value."""
+    return int.from_bytes(code.encode('ascii'), 'big')
+
+# CoreMediaIO constants (CMIOHardwareObject.h, CMIOHardwareSystem.h, CMIOHardwareDevice.h)
+kCMIOObjectSystemObject = 1
+kCMIOObjectPropertyScopeGlobal = _fourcc('glob')
+kCMIOObjectPropertyElementMain = 0
+kCMIOHardwarePropertyDevices = _fourcc('dev#')
+kCMIOHardwarePropertyRunLoop = _fourcc('rnlp')
+kCMIODevicePropertyDeviceIsRunningSomewhere = _fourcc('gone')
+
+class _CMIOObjectPropertyAddress(ctypes.Structure):
+    _fields_ = [
+        ('mSelector', ctypes.c_uint32),
+        ('mScope', ctypes.c_uint32),
+        ('mElement', ctypes.c_uint32),
+    ]
+
+_CMIOObjectPropertyListenerProc = ctypes.CFUNCTYPE(
+    ctypes.c_int32,                                 # OSStatus
+    ctypes.c_uint32,                                # CMIOObjectID
+    ctypes.c_uint32,                                # number of addresses
+    ctypes.POINTER(_CMIOObjectPropertyAddress),     # addresses
+    ctypes.c_void_p                                 # client data
+)
+
+_cmio = None
+
+def _load_cmio():
+    """Bind the CoreMediaIO calls used for device notifications via ctypes."""
+    global _cmio
+    
+    cmio = ctypes.CDLL('/System/Library/Frameworks/CoreMediaIO.framework/CoreMediaIO')
+    address_p = ctypes.POINTER(_CMIOObjectPropertyAddress)
+    uint32_p = ctypes.POINTER(ctypes.c_uint32)
+    
+    cmio.CMIOObjectGetPropertyDataSize.argtypes = [
+        ctypes.c_uint32, address_p, ctypes.c_uint32, ctypes.c_void_p, uint32_p
+    ]
+    cmio.CMIOObjectGetPropertyDataSize.restype = ctypes.c_int32
+    cmio.CMIOObjectGetPropertyData.argtypes = [
+        ctypes.c_uint32, address_p, ctypes.c_uint32, ctypes.c_void_p,
+        ctypes.c_uint32, uint32_p, ctypes.c_void_p
+    ]
+    cmio.CMIOObjectGetPropertyData.restype = ctypes.c_int32
+    cmio.CMIOObjectSetPropertyData.argtypes = [
+        ctypes.c_uint32, address_p, ctypes.c_uint32, ctypes.c_void_p,
+        ctypes.c_uint32, ctypes.c_void_p
+    ]
+    cmio.CMIOObjectSetPropertyData.restype = ctypes.c_int32
+    cmio.CMIOObjectAddPropertyListener.argtypes = [
+        ctypes.c_uint32, address_p, _CMIOObjectPropertyListenerProc, ctypes.c_void_p
     ]
+    cmio.CMIOObjectAddPropertyListener.restype = ctypes.c_int32
     
-    print("Streaming macOS system logs for camera events...\n")
+    # Have CoreMediaIO dispatch notifications on its own thread, so the main
+    # thread doesn't need to run a CFRunLoop (and stays responsive to Ctrl+C)
+    run_loop = ctypes.c_void_p(None)
+    address = _cmio_address(kCMIOHardwarePropertyRunLoop)
+    status = cmio.CMIOObjectSetPropertyData(
+        kCMIOObjectSystemObject, ctypes.byref(address), 0, None,
+        ctypes.sizeof(run_loop), ctypes.byref(run_loop)
+    )
+    if status != 0:
+        raise OSError(f"setting CoreMediaIO run loop failed ({status})")
     
+    _cmio = cmio
+
+def _cmio_address(selector):
+    """Build a global-scope property address for the given selector."""
+    return _CMIOObjectPropertyAddress(
+        selector, kCMIOObjectPropertyScopeGlobal, kCMIOObjectPropertyElementMain
+    )
+
+def _cmio_devices():
+    """Return the CMIOObjectIDs of all video capture devices."""
+    address = _cmio_address(kCMIOHardwarePropertyDevices)
+    size = ctypes.c_uint32(0)
+    status = _cmio.CMIOObjectGetPropertyDataSize(
+        kCMIOObjectSystemObject, ctypes.byref(address), 0, None, ctypes.byref(size)
+    )
+    if status != 0:
+        raise OSError(f"listing CoreMediaIO devices failed ({status})")
+    
+    devices = (ctypes.c_uint32 * (size.value // ctypes.sizeof(ctypes.c_uint32)))()
+    used = ctypes.c_uint32(0)
+    status = _cmio.CMIOObjectGetPropertyData(
+        kCMIOObjectSystemObject, ctypes.byref(address), 0, None,
+        ctypes.sizeof(devices), ctypes.byref(used), devices
+    )
+    if status != 0:
+        raise OSError(f"listing CoreMediaIO devices failed ({status})")
+    return list(devices)[:used.value // ctypes.sizeof(ctypes.c_uint32)]
+
+def _cmio_device_running(device_id):
+    """Return True if any process is currently using the given device."""
+    address = _cmio_address(kCMIODevicePropertyDeviceIsRunningSomewhere)
+    running = ctypes.c_uint32(0)
+    used = ctypes.c_uint32(0)
+    status = _cmio.CMIOObjectGetPropertyData(
+        device_id, ctypes.byref(address), 0, None,
+        ctypes.sizeof(running), ctypes.byref(used), ctypes.byref(running)
+    )
+    # Unplugged devices report an error; treat them as idle
+    return status == 0 and running.value != 0
+
+def monitor_webcam_mac():
+    """
+    Monitor webcam access on macOS via CoreMediaIO device notifications.
+    
+    Each camera's "running somewhere" property is watched, so the OS signals
+    us directly when any app starts or stops using it. Falls back to
+    streaming the system log if CoreMediaIO can't be used.
+    """
     try:
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
-        )
-    except Exception as e:
-        print(f"❌ Failed to start log stream: {e}")
-        print("   Make sure you have permission to access system logs.")
-        sys.exit(1)
+        _load_cmio()
+        _cmio_devices()
+    except (OSError, AttributeError) as e:
+        print(f"⚠️  CoreMediaIO unavailable ({e}) - falling back to log stream")
+        _monitor_webcam_mac_log_stream()
+        return
     
+    lock = threading.Lock()
+    watched = set()
     was_in_use = False
     
-    try:
-        while True:
-            line = process.stdout.readline()
-            if not line:
-                continue
-                
-            line = line.strip()
-            
-            # Filter for actual log entries (start with timestamp)
-            if not re.match(r'^\d{4}-\d{2}-\d{2}', line):
+    def watch_new_devices():
+        for device_id in _cmio_devices():
+            if device_id in watched:
                 continue
-            
-            if "AVCaptureSessionDidStartRunningNotification" in line:
-                if not was_in_use:
-                    print(f"🔴 Webcam STARTED - {datetime.now().strftime('%H:%M:%S')}")
-                    play_beep()
-                    notify_mobile('start', line)
-                was_in_use = True
+            address = _cmio_address(kCMIODevicePropertyDeviceIsRunningSomewhere)
+            status = _cmio.CMIOObjectAddPropertyListener(
+                device_id, ctypes.byref(address), listener, None
+            )
+            if status == 0:
+                watched.add(device_id)
+            else:
+                print(f"⚠️  Could not watch camera {device_id} ({status})")
+    
+    def check_state():
+        nonlocal was_in_use
+        in_use = any(_cmio_device_running(device_id) for device_id in watched)
+        was_in_use = report_state(in_use, was_in_use)
+    
+    def on_property_changed(object_id, address_count, addresses, client_data):
+        # Called on a CoreMediaIO notification thread
+        with lock:
+            try:
+                if object_id == kCMIOObjectSystemObject:
+                    watch_new_devices()  # A camera was plugged in or removed
+                check_state()
+            except Exception as e:
+                print(f"Error checking camera state: {e}")
+        return 0
+    
+    # Must stay referenced for as long as it is registered
+    listener = _CMIOObjectPropertyListenerProc(on_property_changed)
+    
+    with lock:
+        address = _cmio_address(kCMIOHardwarePropertyDevices)
+        _cmio.CMIOObjectAddPropertyListener(
+            kCMIOObjectSystemObject, ctypes.byref(address), listener, None
+        )
+        watch_new_devices()
+        print(f"Watching {len(watched)} camera device(s) via CoreMediaIO...\n")
+        check_state()
+    
+    # Notifications arrive on CoreMediaIO's thread; just wait for Ctrl+C
+    while True:
+        signal.pause()
+
+# Log stream output is parsed as raw bytes; lines are only decoded when forwarded
+_LOG_TS = re.compile(rb'^\d{4}-\d{2}-\d{2}')
+_START = b"AVCaptureSessionDidStartRunningNotification"
+_STOP = b"AVCaptureSessionDidStopRunningNotification"
+
+def _log_stream_predicate():
+    """Build the `log stream` predicate, narrowed to MAC_LOG_SUBSYSTEMS if set."""
+    predicate = (
+        f'eventMessage CONTAINS "{_START.decode()}" OR '
+        f'eventMessage CONTAINS "{_STOP.decode()}"'
+    )
+    subsystems = [s.strip() for s in MAC_LOG_SUBSYSTEMS.split(',') if s.strip()]
+    if subsystems:
+        subsystem_filter = ' OR '.join(f'subsystem == "{s}"' for s in subsystems)
+        predicate = f'({subsystem_filter}) AND ({predicate})'
+    return predicate
+
+def _start_log_stream():
+    """Spawn `log stream` filtered to camera events. Returns the Popen object."""
+    command = ['log', 'stream', '--style=compact', '--predicate', _log_stream_predicate()]
+    return subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1024 * 1024  # Amortize read() syscalls across many lines
+    )
+
+def _read_log_stream(process):
+    """
+    Yield complete lines from the log stream as they arrive.
+    Raises ChildProcessError once the stream reaches EOF.
+    """
+    with selectors.DefaultSelector() as sel:
+        sel.register(process.stdout, selectors.EVENT_READ)
+        pending = b''
+        while True:
+            for key, _ in sel.select(timeout=1.0):
+                # read1() hands back everything already buffered (or does a
+                # single read), so no lines are left waiting behind select()
+                chunk = key.fileobj.read1()
+                if not chunk:
+                    raise ChildProcessError("log stream died")
+                *lines, pending = (pending + chunk).split(b'\n')
+                yield from lines
+
+def _monitor_webcam_mac_log_stream():
+    """Monitor webcam access on macOS via system log stream."""
+    print("Streaming macOS system logs for camera events...\n")
+    
+    was_in_use = False
+    restart_delay = 1
+    
+    while True:
+        try:
+            process = _start_log_stream()
+        except Exception as e:
+            print(f"❌ Failed to start log stream: {e}")
+            print("   Make sure you have permission to access system logs.")
+            sys.exit(1)
+        
+        try:
+            for line in _read_log_stream(process):
+                restart_delay = 1
+                line = line.strip()
                 
-            elif "AVCaptureSessionDidStopRunningNotification" in line:
-                if was_in_use:
-                    print(f"⚪ Webcam STOPPED - {datetime.now().strftime('%H:%M:%S')}")
-                    notify_mobile('stop', line)
-                was_in_use = False
+                # Filter for actual log entries (start with timestamp). The cheap
+                # byte checks reject headers and noise before the regex runs.
+                if not (len(line) >= 10 and line[0:4].isdigit() and line[4:5] == b'-'
+                        and _LOG_TS.match(line)):
+                    continue
                 
-    except KeyboardInterrupt:
-        print("\n\nStopping monitor...")
-        process.terminate()
-        raise
+                # Repeated Start/Stop records are ignored by report_state
+                if _START in line:
+                    was_in_use = report_state(True, was_in_use, line)
+                elif _STOP in line:
+                    was_in_use = report_state(False, was_in_use, line)
+                    
+        except ChildProcessError as e:
+            # Restart a dead `log stream` with capped exponential backoff
+            process.stdout.close()
+            process.wait()
+            print(f"⚠️  {e} (exit code {process.returncode}) - restarting in {restart_delay}s")
+            time.sleep(restart_delay)
+            restart_delay = min(restart_delay * 2, 60)
+            
+        except KeyboardInterrupt:
+            print("\n\nStopping monitor...")
+            process.terminate()
+            raise
 
 # ============================================================================
 # MAIN ENTRY POINT
@@ -305,8 +881,8 @@ def print_banner():
     print("=" * 55)
     print("   📷  WEBCAM MONITOR  📷")
     print("=" * 55)
-    print(f"   Platform:      {platform.system()} ({platform.release()})")
-    print(f"   Device:        {platform.node()}")
+    print(f"   Platform:      {_DEVICE_OS} ({platform.release()})")
+    print(f"   Device:        {_DEVICE_NAME}")
     print(f"   Mobile Sync:   {'✅ Enabled' if FIREBASE_ENABLED else '❌ Disabled'}")
     print("=" * 55)
     print()
@@ -322,7 +898,7 @@ def main():
     print_banner()
     
     # Start monitoring based on OS
-    os_name = platform.system()
+    os_name = _DEVICE_OS
     
     try:
         if os_name == 'Windows':